@@ -1,31 +1,62 @@
 """Phone Link UI automation helpers for QueueBreaker."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
-from datetime import datetime
+import ctypes
 import logging
+import re
 import time
-from typing import Optional
+from typing import Any, Mapping, Optional
 
+from uia_events import WindowEventWatcher
 from utils import sleep_with_stop
+from win_input import send_shortcut
 
 try:  # pragma: no cover - optional dependency in CI
     import pyautogui as pag
     pag.FAILSAFE = False
+    pag.PAUSE = 0
 except Exception as exc:  # pragma: no cover - pyautogui not available on linux CI
     pag = None
     _PYAUTOGUI_ERROR = exc
 else:
     _PYAUTOGUI_ERROR = None
 
+try:  # pragma: no cover - keyboard is Windows-only
+    import keyboard
+except Exception as exc:  # pragma: no cover
+    keyboard = None
+    _KEYBOARD_ERROR = exc
+else:
+    _KEYBOARD_ERROR = None
+
+# Keystrokes go through the keyboard module, or PyAutoGUI when it is missing.
+_KEYS_AVAILABLE = keyboard is not None or pag is not None
+
 try:  # pragma: no cover - optional dependency in CI
+    from comtypes import COMError
     from pywinauto import Application
+    from pywinauto.findwindows import ElementNotFoundError
+    from pywinauto.timings import Timings
 except Exception as exc:  # pragma: no cover
     Application = None
+    Timings = None
+    _STALE_CONTROL_ERRORS: tuple = ()
     _PYWINAUTO_ERROR = exc
 else:
+    _STALE_CONTROL_ERRORS = (COMError, ElementNotFoundError)
     _PYWINAUTO_ERROR = None
 
+# Skip re-focusing Phone Link if it was focused this recently and is still active.
+FOCUS_REUSE_SECONDS = 30
+
+SW_RESTORE = 9
+
+_CALL_RE = re.compile(r".*call.*", re.I)
+_HANGUP_RE = re.compile(r".*hang.*|.*end.*", re.I)
+
 
 @dataclass
 class DialResult:
@@ -37,8 +68,9 @@ class DialResult:
 class Dialer:
     """Wrap Windows Phone Link automation routines."""
 
-    def __init__(self, settings: dict) -> None:
+    def __init__(self, settings: Mapping[str, Any]) -> None:
         self.phone_link_title = settings.get("phone_link_title", "Phone Link")
+        self._phone_link_re = re.compile(self.phone_link_title)
         self.dial_pad_shortcut = settings.get(
             "dial_pad_shortcut", ["ctrl", "shift", "d"]
         )
@@ -47,25 +79,53 @@ class Dialer:
         )
         self.hangup_shortcut = settings.get("hangup_shortcut", ["esc"])
         self.number_field_click = settings.get("number_field_click")
+        self.backend = settings.get("pywinauto_backend", "uia")
+        self.timings_profile = settings.get("timings_profile", "fast")
+        self.uia_events = bool(settings.get("uia_events", True))
         self._app: Optional[Application] = None
+        self._window = None
+        self._call_btn = None
+        self._hangup_btn = None
+        self._edit = None
+        self._hwnd: Optional[int] = None
+        self._window_focused_ts: Optional[float] = None
+        self._watcher = WindowEventWatcher()
+        # Outcome detection runs here so it overlaps the observation delay.
+        self._executor = ThreadPoolExecutor(max_workers=1)
         self._warn_if_missing_dependencies()
+        self._apply_timings_profile()
+
+    def close(self) -> None:
+        """Unsubscribe from UIA events and stop the detection worker."""
+
+        self._watcher.stop()
+        self._executor.shutdown(wait=False)
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:  # pragma: no cover - interpreter shutdown
+            pass
 
     # ------------------------------------------------------------------
     def execute_call(self, phone_number: str, observation_delay: float, stop_event=None) -> DialResult:
         """Dial ``phone_number`` and return meta information."""
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         self.focus_phone_link()
         self.open_dial_pad()
         self.enter_phone_number(phone_number)
         self.trigger_call()
+        future = self._executor.submit(self.detect_call_outcome)
         sleep_with_stop(observation_delay, stop_event)
         termination_reason = "unknown"
         try:
-            termination_reason = self.detect_call_outcome()
+            termination_reason = future.result(timeout=0.1)
+        except FuturesTimeoutError:
+            logging.debug("Call outcome detection did not finish in time")
         finally:
             self.hang_up()
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         window_state = self.capture_window_state()
         return DialResult(duration, termination_reason, window_state)
 
@@ -76,79 +136,89 @@ class Dialer:
         if Application is not None:
             try:
                 if self._app is None:
-                    self._app = Application(backend="uia").connect(
-                        title_re=self.phone_link_title
+                    self._app = Application(backend=self.backend).connect(
+                        title_re=self._phone_link_re
                     )
-                window = self._app.top_window()
-                window.set_focus()
+                if self._watcher.running and not self._watcher.window_ready.is_set():
+                    # The window closed since the last attempt; re-resolve it
+                    # and subscribe again once the new window is known.
+                    self._watcher.stop()
+                    self._reset_window_cache()
+                window = self._get_window()
+                if self._recently_focused() and not self._is_minimized() and window.is_active():
+                    logging.debug("Phone Link window already active")
+                    return
+                self._bring_to_front(window)
+                self._window_focused_ts = time.monotonic()
                 logging.debug("Focused Phone Link window via pywinauto")
+                self._start_event_watcher(window)
                 return
             except Exception as exc:  # pragma: no cover - UI automation is Windows-only
+                self._reset_window_cache()
                 logging.debug("pywinauto focus failed: %s", exc)
 
-        if pag is None:
+        if not _KEYS_AVAILABLE:
             raise RuntimeError(
-                f"PyAutoGUI is required to focus Phone Link. Original import error: {_PYAUTOGUI_ERROR}"
+                "keyboard or PyAutoGUI is required to focus Phone Link. "
+                f"Import errors: {_KEYBOARD_ERROR}; {_PYAUTOGUI_ERROR}"
             )
 
         # Fallback: Windows Search -> Phone Link.
-        pag.hotkey("win", "s")
+        self._send_hotkey(["win", "s"])
         time.sleep(0.4)
-        pag.write(self.phone_link_title)
-        pag.press("enter")
+        self._type_text(self.phone_link_title)
+        self._send_hotkey(["enter"])
         time.sleep(1)
+        # The next focus_phone_link call connects pywinauto once the window exists.
         logging.debug("Focused Phone Link using Windows Search")
-        if Application is not None and self._app is None:
-            try:
-                self._app = Application(backend="uia").connect(
-                    title_re=self.phone_link_title
-                )
-            except Exception as exc:  # pragma: no cover - Windows only
-                logging.debug("pywinauto reconnect after search failed: %s", exc)
 
     def open_dial_pad(self) -> None:
-        if pag is None:
+        if not _KEYS_AVAILABLE:
             return
         time.sleep(0.3)
-        pag.hotkey(*self.dial_pad_shortcut)
+        self._send_hotkey(self.dial_pad_shortcut)
         time.sleep(0.3)
 
     def enter_phone_number(self, phone_number: str) -> None:
-        if pag is None:
+        if not _KEYS_AVAILABLE:
             return
         self._focus_number_field()
-        pag.hotkey("ctrl", "a")
-        pag.press("backspace")
-        pag.write(phone_number, interval=0.05)
+        self._send_hotkey(["ctrl", "a"])
+        self._send_hotkey(["backspace"])
+        self._type_text(phone_number)
         logging.debug("Entered phone number %s", phone_number)
 
     def trigger_call(self) -> None:
         def _uia():
-            window = self._app.top_window()
-            call_button = window.child_window(title_re=".*call.*", control_type="Button")
-            call_button.click_input()
+            self._click_control("_call_btn", self._call_button)
 
         self._do_with_fallback(
             "trigger_call",
             ui_action=_uia if Application is not None and self._app is not None else None,
-            pag_action=(lambda: pag.hotkey(*self.call_button_shortcut)) if pag is not None else None,
+            key_action=(lambda: self._send_hotkey(self.call_button_shortcut)) if _KEYS_AVAILABLE else None,
         )
 
     def hang_up(self) -> None:
         def _uia():
-            window = self._app.top_window()
-            hangup_button = window.child_window(title_re=".*hang.*|.*end.*", control_type="Button")
-            hangup_button.click_input()
+            self._click_control("_hangup_btn", self._hangup_button)
 
         self._do_with_fallback(
             "hang_up",
             ui_action=_uia if Application is not None and self._app is not None else None,
-            pag_action=(lambda: pag.hotkey(*self.hangup_shortcut)) if pag is not None else None,
-            require_pag=False,
+            key_action=(lambda: self._send_hotkey(self.hangup_shortcut)) if _KEYS_AVAILABLE else None,
+            require_keys=False,
         )
 
     def detect_call_outcome(self) -> str:
-        """Placeholder for future OCR/IVR detection."""
+        """Placeholder for future OCR/IVR detection.
+
+        Runs on the single-worker ``self._executor`` thread, overlapping the
+        observation delay.  It must finish within that delay: a running
+        detection cannot be cancelled, so one that hangs blocks every later
+        attempt's detection, which then times out to ``"unknown"``.  The
+        worker thread is not COM-initialised; UIA or other COM based code
+        has to call ``CoInitializeEx`` itself.
+        """
 
         # Real call-state analysis is highly device specific.  Returning
         # "unknown" keeps the logging consistent while still giving users a
@@ -158,28 +228,190 @@ class Dialer:
     def capture_window_state(self) -> Optional[str]:
         if Application is None or self._app is None:
             return None
+        if self._watcher.running and self._watcher.window_ready.is_set():
+            state = self._watcher.last_state()
+            if state is not None:
+                return state
         try:
-            window = self._app.top_window()
+            window = self._get_window()
             element = window.element_info
             return f"{element.name} | {element.control_type} | Visible={window.is_visible()}"
         except Exception:  # pragma: no cover - depends on Windows UIA
+            self._reset_window_cache()
             return None
 
     def _warn_if_missing_dependencies(self) -> None:
-        if pag is None:
+        if not _KEYS_AVAILABLE:
             logging.warning(
-                "PyAutoGUI is not available. Keyboard/mouse automation will fail: %s",
+                "Neither keyboard nor PyAutoGUI is available. Keyboard automation will fail: %s; %s",
+                _KEYBOARD_ERROR,
                 _PYAUTOGUI_ERROR,
             )
+        elif pag is None:
+            logging.warning(
+                "PyAutoGUI is not available; the number_field_click coordinate click is disabled: %s",
+                _PYAUTOGUI_ERROR,
+            )
+        elif keyboard is None:
+            logging.debug("keyboard not available, using PyAutoGUI for keys: %s", _KEYBOARD_ERROR)
         if Application is None:
             logging.debug("pywinauto not available: %s", _PYWINAUTO_ERROR)
 
+    def _send_hotkey(self, keys) -> None:
+        """Press ``keys`` together, preferring one native ``SendInput`` call."""
+
+        if send_shortcut(keys):
+            return
+        if keyboard is not None:
+            keyboard.send("+".join(keys))
+        else:
+            pag.hotkey(*keys)
+
+    def _type_text(self, text: str) -> None:
+        if keyboard is not None:
+            keyboard.write(text, delay=0)
+        else:
+            pag.write(text)
+
+    def _apply_timings_profile(self) -> None:
+        """Shorten pywinauto's post-input waits unless ``default`` is requested."""
+
+        if Timings is None or self.timings_profile != "fast":
+            return
+        Timings.after_clickinput_wait = 0.01
+        Timings.after_setcursorpos_wait = 0.01
+        Timings.after_sendkeys_key_wait = 0
+        Timings.after_button_click_wait = 0
+        try:  # pragma: no cover - Windows only
+            import win32gui
+        except Exception as exc:  # pragma: no cover
+            logging.debug("win32gui not available: %s", exc)
+        else:  # pragma: no cover - Windows only
+            # click_input() otherwise waits out the double-click interval.
+            win32gui.GetDoubleClickTime = lambda: 0
+        logging.debug("Applied fast pywinauto timings")
+
+    def _start_event_watcher(self, window) -> None:
+        """Subscribe to Phone Link UIA events once the window is known.
+
+        A running watcher is kept unless ``window`` resolved to a different
+        HWND than the one it is subscribed to.
+        """
+
+        if not self.uia_events or self.backend != "uia":
+            return
+        try:
+            hwnd = self._hwnd if self._hwnd is not None else window.handle
+            if self._watcher.running:
+                if self._watcher.hwnd == hwnd:
+                    return
+                self._watcher.stop()
+            self._watcher.start(hwnd)
+        except Exception as exc:  # pragma: no cover - Windows only
+            logging.debug("Starting UIA event watcher failed: %s", exc)
+
+    def _bring_to_front(self, window) -> None:
+        """Foreground ``window`` with a single SetForegroundWindow call.
+
+        A minimized window is restored first, since SetForegroundWindow alone
+        activates it but leaves it iconic.  pywinauto's ``set_focus`` is only
+        used when the native calls fail.
+        """
+
+        try:
+            if self._hwnd is None:
+                self._hwnd = window.handle
+            user32 = ctypes.windll.user32
+            if user32.IsIconic(self._hwnd):
+                user32.ShowWindow(self._hwnd, SW_RESTORE)
+            elif user32.GetForegroundWindow() == self._hwnd:
+                return
+            if user32.SetForegroundWindow(self._hwnd):
+                return
+        except Exception as exc:  # pragma: no cover - Windows only
+            logging.debug("SetForegroundWindow failed: %s", exc)
+        window.set_focus()
+
+    def _is_minimized(self) -> bool:
+        if self._hwnd is None:
+            return False
+        try:
+            return bool(ctypes.windll.user32.IsIconic(self._hwnd))
+        except Exception:  # pragma: no cover - Windows only
+            return False
+
+    def _recently_focused(self) -> bool:
+        return (
+            self._window_focused_ts is not None
+            and time.monotonic() - self._window_focused_ts < FOCUS_REUSE_SECONDS
+        )
+
+    def _get_window(self):
+        """Return the cached Phone Link top window, resolving it on first use."""
+
+        if self._window is None:
+            self._window = self._app.top_window()
+        return self._window
+
+    def _reset_window_cache(self) -> None:
+        """Drop cached pywinauto handles so the next call re-resolves them.
+
+        The event watcher keeps running; :meth:`_start_event_watcher` moves it
+        to the new window only if the re-resolved HWND differs.
+        """
+
+        self._window = None
+        self._call_btn = None
+        self._hangup_btn = None
+        self._edit = None
+        self._hwnd = None
+        self._window_focused_ts = None
+
+    def _call_button(self):
+        if self._call_btn is None:
+            self._call_btn = self._get_window().child_window(
+                title_re=_CALL_RE, control_type="Button"
+            ).wrapper_object()
+        return self._call_btn
+
+    def _hangup_button(self):
+        if self._hangup_btn is None:
+            self._hangup_btn = self._get_window().child_window(
+                title_re=_HANGUP_RE, control_type="Button"
+            ).wrapper_object()
+        return self._hangup_btn
+
+    def _number_field(self):
+        if self._edit is None:
+            self._edit = self._get_window().child_window(
+                control_type="Edit"
+            ).wrapper_object()
+        return self._edit
+
+    def _click_control(self, attr: str, resolve) -> None:
+        """Click the control from ``resolve``, cached on ``self.<attr>``.
+
+        Only a cached wrapper is retried: it is dropped and looked up once
+        more.  A fresh lookup that fails already waited out pywinauto's
+        ``window_find_timeout``, so its error goes straight to the caller's
+        keyboard fallback.
+        """
+
+        cached = getattr(self, attr) is not None
+        try:
+            resolve().click_input()
+            return
+        except Exception as exc:  # pragma: no cover - Windows only
+            setattr(self, attr, None)
+            if not cached or not isinstance(exc, _STALE_CONTROL_ERRORS):
+                raise
+            logging.debug("Cached %s went stale, re-resolving: %s", attr, exc)
+        resolve().click_input()  # pragma: no cover - Windows only
+
     def _focus_number_field(self) -> bool:
         if Application is not None and self._app is not None:
             try:
-                window = self._app.top_window()
-                edit = window.child_window(control_type="Edit")
-                edit.click_input()
+                self._click_control("_edit", self._number_field)
                 logging.debug("Focused number field via pywinauto")
                 return True
             except Exception as exc:  # pragma: no cover - Windows only
@@ -195,7 +427,7 @@ class Dialer:
                 logging.debug("Coordinate click for number field failed: %s", exc)
         return False
 
-    def _do_with_fallback(self, label: str, ui_action=None, pag_action=None, require_pag: bool = True) -> None:
+    def _do_with_fallback(self, label: str, ui_action=None, key_action=None, require_keys: bool = True) -> None:
         if Application is not None and self._app is not None and ui_action is not None:
             try:
                 ui_action()
@@ -204,19 +436,13 @@ class Dialer:
             except Exception as exc:  # pragma: no cover - Windows only
                 logging.debug("pywinauto %s failed: %s", label, exc)
 
-        if pag_action is None:
-            if require_pag and pag is None:
-                raise RuntimeError(
-                    f"PyAutoGUI is required for {label}. Import error: {_PYAUTOGUI_ERROR}"
-                )
-            return
-
-        if pag is None:
-            if require_pag:
+        if key_action is None or not _KEYS_AVAILABLE:
+            if require_keys:
                 raise RuntimeError(
-                    f"PyAutoGUI is required for {label}. Import error: {_PYAUTOGUI_ERROR}"
+                    f"keyboard or PyAutoGUI is required for {label}. "
+                    f"Import errors: {_KEYBOARD_ERROR}; {_PYAUTOGUI_ERROR}"
                 )
             return
 
-        pag_action()
-        logging.debug("%s via PyAutoGUI", label)
+        key_action()
+        logging.debug("%s via keyboard shortcut", label)
@@ -3,10 +3,12 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from pathlib import Path
 from datetime import datetime
 import threading
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 
 try:  # pragma: no cover - keyboard is Windows-only
     import keyboard
@@ -21,6 +23,8 @@ from scheduler import BurstScheduler
 
 SETTINGS_PATH = Path("settings.json")
 ATTEMPT_LOG = Path("attempt_log.txt")
+# Buffered attempt lines are written out after this many attempts.
+LOG_FLUSH_EVERY = 10
 DEFAULT_SETTINGS: Dict[str, Any] = {
     "phone_number": "1-800-480-3287",
     "start_minute": 58,
@@ -32,17 +36,39 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
     "active_hours": [],
     "phone_link_title": "Phone Link",
     "number_field_click": None,
+    "pywinauto_backend": "uia",
+    "timings_profile": "fast",
+    "uia_events": True,
 }
 
 
-def load_settings() -> Dict[str, Any]:
+def _freeze(value: Any) -> Any:
+    """Return a read-only version of a parsed JSON value."""
+
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+# Parsed, read-only settings keyed by settings.json's mtime; only the latest
+# is kept.  Being read-only, cache hits are returned without copying.
+_SETTINGS_CACHE: Dict[int, Mapping[str, Any]] = {}
+
+
+def load_settings() -> Mapping[str, Any]:
     if not SETTINGS_PATH.exists():
         SETTINGS_PATH.write_text(json.dumps(DEFAULT_SETTINGS, indent=2))
         logging.info("Created default settings.json")
-        return dict(DEFAULT_SETTINGS)
-    user_settings = json.loads(SETTINGS_PATH.read_text())
-    merged = dict(DEFAULT_SETTINGS)
-    merged |= user_settings
+        return _freeze(DEFAULT_SETTINGS)
+    mtime = SETTINGS_PATH.stat().st_mtime_ns
+    merged = _SETTINGS_CACHE.get(mtime)
+    if merged is None:
+        user_settings = json.loads(SETTINGS_PATH.read_text())
+        merged = _freeze({**DEFAULT_SETTINGS, **user_settings})
+        _SETTINGS_CACHE.clear()
+        _SETTINGS_CACHE[mtime] = merged
     return merged
 
 
@@ -67,16 +93,30 @@ def register_hotkey(stop_event: threading.Event) -> None:
     logging.info("Emergency stop armed: press F12 to halt dialing")
 
 
-def append_attempt_log(attempt_no: int, result) -> None:
+def open_attempt_log() -> int:
+    """Open ``attempt_log.txt`` once for the whole run and return its descriptor."""
+
     ATTEMPT_LOG.parent.mkdir(parents=True, exist_ok=True)
+    return os.open(str(ATTEMPT_LOG), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+
+def append_attempt_log(attempt_no: int, result, buf: List[str]) -> None:
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     window_state = result.window_state or "n/a"
     line = (
         f"{timestamp} | Attempt {attempt_no:03d} | Duration {result.duration_seconds:.1f}s | "
         f"Termination {result.termination_reason} | Window {window_state}\n"
     )
-    with ATTEMPT_LOG.open("a", encoding="utf-8") as handle:
-        handle.write(line)
+    buf.append(line)
+
+
+def flush_attempt_log(buf: List[str], fd: int) -> None:
+    """Write the buffered attempt lines in one block and empty ``buf``."""
+
+    if not buf:
+        return
+    os.write(fd, "".join(buf).encode("utf-8"))
+    buf.clear()
 
 
 def main() -> None:
@@ -100,22 +140,31 @@ def main() -> None:
     logging.info("Starting QueueBreaker for %s (max attempts: %s)", phone_number, max_attempts)
 
     attempt = 0
-    while attempt < max_attempts and not stop_event.is_set():
-        scheduler.wait_for_window(stop_event)
-        if stop_event.is_set():
-            break
-
-        attempt += 1
-        logging.info("Attempt %s/%s", attempt, max_attempts)
-        result = dialer.execute_call(phone_number, observation_delay, stop_event)
-        append_attempt_log(attempt, result)
-        logging.info(
-            "Completed attempt %s: %.1fs (%s)",
-            attempt,
-            result.duration_seconds,
-            result.termination_reason,
-        )
-        scheduler.sleep_between_attempts(delay_between_attempts, stop_event)
+    log_buffer: List[str] = []
+    log_fd = open_attempt_log()
+    try:
+        while attempt < max_attempts and not stop_event.is_set():
+            scheduler.wait_for_window(stop_event)
+            if stop_event.is_set():
+                break
+
+            attempt += 1
+            logging.info("Attempt %s/%s", attempt, max_attempts)
+            result = dialer.execute_call(phone_number, observation_delay, stop_event)
+            append_attempt_log(attempt, result, log_buffer)
+            if len(log_buffer) >= LOG_FLUSH_EVERY:
+                flush_attempt_log(log_buffer, log_fd)
+            logging.info(
+                "Completed attempt %s: %.1fs (%s)",
+                attempt,
+                result.duration_seconds,
+                result.termination_reason,
+            )
+            scheduler.sleep_between_attempts(delay_between_attempts, stop_event)
+    finally:
+        flush_attempt_log(log_buffer, log_fd)
+        os.close(log_fd)
+        dialer.close()
 
     logging.info("QueueBreaker finished after %s attempts", attempt)
 
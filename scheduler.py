@@ -6,40 +6,38 @@ starts.  It supports two modes:
 * every_hour  - the window repeats every hour of the day.
 * specific_hours - only the provided hours (24h clock) are eligible.
 
-The functions keep sleeping in small chunks so that the emergency stop
-hotkey can still interrupt the process immediately.
+The functions sleep on the stop event so that the emergency stop hotkey
+can still interrupt the process immediately.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
 from typing import Iterable, Optional
 
 from utils import sleep_with_stop
 
 
-@dataclass
+@dataclass(frozen=True)
 class BurstWindow:
     """Simple value object used by :class:`BurstScheduler`."""
 
+    __slots__ = ("start_minute", "end_minute")
+
     start_minute: int
     end_minute: int
 
     def contains(self, minute: int) -> bool:
-        """Return ``True`` if ``minute`` is inside the burst window."""
-
-        minute %= 60
-        start = self.start_minute % 60
-        end = self.end_minute % 60
+        """Return ``True`` if ``minute`` is inside the burst window.
 
-        if start == end:
-            # Whole hour is considered active.
-            return True
+        Both bounds are inclusive.  Distances are measured forward from the
+        start minute, which handles windows wrapping the top of the hour; a
+        window whose start equals its end covers the whole hour.
+        """
 
-        if start < end:
-            return start <= minute <= end
-        return minute >= start or minute <= end
+        width = (self.end_minute - self.start_minute) % 60
+        return width == 0 or (minute - self.start_minute) % 60 <= width
 
 
 class BurstScheduler:
@@ -91,17 +89,27 @@ class BurstScheduler:
     # internals
     # ------------------------------------------------------------------
     def _hour_is_active(self, ts: datetime) -> bool:
-        if self.schedule_mode != "specific_hours":
+        return self._hour_number_is_active(ts.hour)
+
+    def _hour_number_is_active(self, hour: int) -> bool:
+        if self.schedule_mode != "specific_hours" or not self.active_hours:
             return True
-        return True if not self.active_hours else ts.hour in self.active_hours
+        return hour % 24 in self.active_hours
 
     def _seconds_until_next_window(self, now: datetime) -> float:
-        candidate = now.replace(second=0, microsecond=0)
-        # Search up to two days ahead which covers every possible combination.
-        for _ in range(1, 60 * 24 * 2):
-            candidate += timedelta(minutes=1)
-            if self._hour_is_active(candidate) and self.window.contains(candidate.minute):
-                delta = candidate - now
-                return max(delta.total_seconds(), 1.0)
-        # Should never happen but keeps us safe.
-        return 60.0
+        # Work in minutes since midnight so the answer is
+        # plain integer arithmetic instead of a minute-by-minute scan.
+        if self.window.contains(now.minute + 1):
+            steps = 1
+        else:
+            steps = (self.window.start_minute - now.minute - 1) % 60 + 1
+        target = now.hour * 60 + now.minute + steps
+
+        target_hour = target // 60
+        if not self._hour_number_is_active(target_hour):
+            first_minute = 0 if self.window.contains(0) else self.window.start_minute % 60
+            hours_ahead = min((h - target_hour) % 24 for h in self.active_hours)
+            target = (target_hour + hours_ahead) * 60 + first_minute
+
+        delta = (target - now.hour * 60 - now.minute) * 60 - now.second - now.microsecond / 1e6
+        return max(delta, 1.0)
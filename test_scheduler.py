@@ -0,0 +1,81 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from scheduler import BurstScheduler, BurstWindow
+
+
+def _reference_contains(start, end, minute):
+    """Branching window check the scheduler originally used."""
+    minute %= 60
+    start %= 60
+    end %= 60
+    if start == end:
+        return True
+    if start < end:
+        return start <= minute <= end
+    return minute >= start or minute <= end
+
+
+def _reference_seconds_until(scheduler, start, end, now):
+    """Minute-by-minute scan the closed-form computation replaced."""
+    candidate = now.replace(second=0, microsecond=0)
+    for _ in range(1, 60 * 24 * 2):
+        candidate += timedelta(minutes=1)
+        if scheduler._hour_is_active(candidate) and _reference_contains(start, end, candidate.minute):
+            return max((candidate - now).total_seconds(), 1.0)
+    return 60.0
+
+
+class SecondsUntilNextWindowTest(unittest.TestCase):
+    """Compare the closed-form next-window wait with a brute-force scan."""
+
+    def test_matches_reference_scan(self):
+        rng = random.Random(1234)
+        for _ in range(3000):
+            start, end = rng.randrange(60), rng.randrange(60)
+            mode = rng.choice(["every_hour", "specific_hours"])
+            hours = rng.sample(range(24), rng.randrange(0, 4))
+            now = datetime(
+                2024, 1, 31,
+                rng.randrange(24), rng.randrange(60), rng.randrange(60), rng.randrange(10 ** 6),
+            )
+            scheduler = BurstScheduler(start, end, mode, hours)
+            with self.subTest(start=start, end=end, mode=mode, hours=hours, now=now):
+                self.assertAlmostEqual(
+                    scheduler._seconds_until_next_window(now),
+                    _reference_seconds_until(scheduler, start, end, now),
+                    places=6,
+                )
+
+    def test_wrapping_window_waits_until_start(self):
+        scheduler = BurstScheduler(58, 2)
+        now = datetime(2024, 1, 1, 10, 30, 15)
+        self.assertEqual(scheduler._seconds_until_next_window(now), 27 * 60 + 45)
+
+    def test_specific_hours_skips_to_next_active_hour(self):
+        scheduler = BurstScheduler(0, 5, "specific_hours", [9])
+        now = datetime(2024, 1, 1, 10, 30)
+        self.assertEqual(scheduler._seconds_until_next_window(now), 22 * 3600 + 30 * 60)
+
+
+class BurstWindowContainsTest(unittest.TestCase):
+    """Compare the modular-arithmetic window check with the branching one."""
+
+    def test_matches_reference_contains(self):
+        for start in range(-5, 70):
+            for end in range(-5, 70):
+                window = BurstWindow(start, end)
+                for minute in range(-3, 125):
+                    self.assertEqual(
+                        window.contains(minute),
+                        _reference_contains(start, end, minute),
+                        (start, end, minute),
+                    )
+
+    def test_bounds_are_inclusive(self):
+        window = BurstWindow(58, 2)
+        self.assertTrue(window.contains(58))
+        self.assertTrue(window.contains(2))
+        self.assertFalse(window.contains(3))
+        self.assertFalse(window.contains(57))
@@ -0,0 +1,78 @@
+import ctypes
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import win_input
+from win_input import (
+    INPUT,
+    INPUT_KEYBOARD,
+    KEYEVENTF_EXTENDEDKEY,
+    KEYEVENTF_KEYUP,
+    send_shortcut,
+    virtual_key,
+)
+
+
+class _FakeUser32:
+    """Record the INPUT array handed to SendInput."""
+
+    def __init__(self):
+        self.events = None
+
+    def SendInput(self, count, events, size):
+        assert size == ctypes.sizeof(INPUT)
+        self.events = [(e.type, e.ki.wVk, e.ki.dwFlags) for e in events[:count]]
+        return count
+
+
+class SendShortcutTest(unittest.TestCase):
+    """Check the INPUT array send_shortcut builds for SendInput."""
+
+    def _send(self, keys):
+        user32 = _FakeUser32()
+        with mock.patch.object(win_input.ctypes, "windll", SimpleNamespace(user32=user32), create=True):
+            self.assertTrue(send_shortcut(keys))
+        return user32.events
+
+    def test_presses_in_order_and_releases_in_reverse(self):
+        self.assertEqual(
+            self._send(["ctrl", "shift", "d"]),
+            [
+                (INPUT_KEYBOARD, 0x11, 0),
+                (INPUT_KEYBOARD, 0x10, 0),
+                (INPUT_KEYBOARD, ord("D"), 0),
+                (INPUT_KEYBOARD, ord("D"), KEYEVENTF_KEYUP),
+                (INPUT_KEYBOARD, 0x10, KEYEVENTF_KEYUP),
+                (INPUT_KEYBOARD, 0x11, KEYEVENTF_KEYUP),
+            ],
+        )
+
+    def test_extended_keys_are_flagged(self):
+        self.assertEqual(
+            self._send(["win", "left"]),
+            [
+                (INPUT_KEYBOARD, 0x5B, KEYEVENTF_EXTENDEDKEY),
+                (INPUT_KEYBOARD, 0x25, KEYEVENTF_EXTENDEDKEY),
+                (INPUT_KEYBOARD, 0x25, KEYEVENTF_EXTENDEDKEY | KEYEVENTF_KEYUP),
+                (INPUT_KEYBOARD, 0x5B, KEYEVENTF_EXTENDEDKEY | KEYEVENTF_KEYUP),
+            ],
+        )
+
+    def test_unknown_key_sends_nothing(self):
+        user32 = _FakeUser32()
+        with mock.patch.object(win_input.ctypes, "windll", SimpleNamespace(user32=user32), create=True):
+            self.assertFalse(send_shortcut(["ctrl", "hyper"]))
+        self.assertIsNone(user32.events)
+
+
+class VirtualKeyTest(unittest.TestCase):
+    def test_known_names(self):
+        self.assertEqual(virtual_key("Esc"), 0x1B)
+        self.assertEqual(virtual_key("f12"), 0x7B)
+        self.assertEqual(virtual_key("7"), ord("7"))
+
+    def test_unknown_names(self):
+        self.assertIsNone(virtual_key("hyper"))
+        self.assertIsNone(virtual_key("é"))
+        self.assertIsNone(virtual_key("+"))
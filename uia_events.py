@@ -0,0 +1,205 @@
+"""UI Automation event subscriptions for QueueBreaker.
+
+Probing Phone Link through pywinauto walks the UIA tree and crosses the COM
+boundary on every call.  :class:`WindowEventWatcher` instead subscribes to
+UIA events on a dedicated STA thread and keeps the most recent window state in
+memory, so the dialer can read it without touching UIA.
+"""
+from __future__ import annotations
+
+import ctypes
+import logging
+import threading
+from typing import Optional
+
+try:  # pragma: no cover - Windows only
+    import comtypes
+    import comtypes.client
+    from ctypes import wintypes
+
+    UIA = comtypes.client.GetModule("UIAutomationCore.dll")
+except Exception as exc:  # pragma: no cover - comtypes not available on linux CI
+    UIA = None
+    _UIA_ERROR = exc
+else:
+    _UIA_ERROR = None
+
+try:  # pragma: no cover - optional dependency in CI
+    from pywinauto.uia_defines import IUIA
+except Exception:  # pragma: no cover
+    IUIA = None
+
+UIA_WINDOW_CLOSED_EVENT_ID = 20017
+UIA_BOUNDING_RECTANGLE_PROPERTY_ID = 30001
+UIA_NAME_PROPERTY_ID = 30005
+UIA_IS_ENABLED_PROPERTY_ID = 30010
+UIA_IS_OFFSCREEN_PROPERTY_ID = 30022
+PM_REMOVE = 0x0001
+PUMP_INTERVAL = 0.05
+
+
+if UIA is not None:  # pragma: no cover - Windows only
+
+    class _AutomationEventHandler(comtypes.COMObject):
+        _com_interfaces_ = [UIA.IUIAutomationEventHandler]
+
+        def __init__(self, callback) -> None:
+            super().__init__()
+            self._callback = callback
+
+        def HandleAutomationEvent(self, sender, event_id):
+            self._callback(sender, event_id)
+
+    class _PropertyChangedEventHandler(comtypes.COMObject):
+        _com_interfaces_ = [UIA.IUIAutomationPropertyChangedEventHandler]
+
+        def __init__(self, callback) -> None:
+            super().__init__()
+            self._callback = callback
+
+        def HandlePropertyChangedEvent(self, sender, property_id, new_value):
+            self._callback(sender, property_id, new_value)
+
+
+class WindowEventWatcher:
+    """Track Phone Link window events pushed by UI Automation.
+
+    The watcher owns a daemon thread that initializes COM as a single
+    threaded apartment, registers the handlers and pumps window messages
+    until :meth:`stop` is called.  The cached state always describes the
+    Phone Link window itself: it is read once on subscribe and refreshed by
+    Name, IsEnabled, IsOffscreen and BoundingRectangle changes on that window,
+    which keeps the ``Visible=`` flag current.  Closing the window clears
+    :attr:`window_ready`.
+    """
+
+    def __init__(self) -> None:
+        self.window_ready = threading.Event()
+        self.hwnd: Optional[int] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._last_state: Optional[str] = None
+        self._root_runtime_id: Optional[tuple] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def last_state(self) -> Optional[str]:
+        with self._lock:
+            return self._last_state
+
+    # ------------------------------------------------------------------
+    def start(self, hwnd: int) -> bool:
+        """Subscribe to events for the window ``hwnd``.
+
+        Returns ``False`` when UI Automation is unavailable or the watcher is
+        already running.
+        """
+
+        if UIA is None:
+            logging.debug("UIA events not available: %s", _UIA_ERROR)
+            return False
+        if self.running:
+            return False
+        self._stop.clear()
+        self.hwnd = hwnd
+        self._thread = threading.Thread(
+            target=self._run, args=(hwnd,), name="uia-events", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                # Keep the reference so ``running`` stays true and no second
+                # watcher starts while this one is still pumping.
+                logging.debug("UIA event watcher did not stop within %.1fs", timeout)
+            else:
+                self._thread = None
+        self.window_ready.clear()
+
+    # ------------------------------------------------------------------
+    def _run(self, hwnd: int) -> None:  # pragma: no cover - Windows only
+        comtypes.CoInitializeEx(comtypes.COINIT_APARTMENTTHREADED)
+        uia = None
+        try:
+            uia = comtypes.client.CreateObject(
+                UIA.CUIAutomation, interface=UIA.IUIAutomation
+            )
+            element = uia.ElementFromHandle(hwnd)
+            self._root_runtime_id = tuple(element.GetRuntimeId())
+            self._record(element)
+            self.window_ready.set()
+
+            uia.AddAutomationEventHandler(
+                UIA_WINDOW_CLOSED_EVENT_ID,
+                element,
+                UIA.TreeScope_Subtree,
+                None,
+                _AutomationEventHandler(self._on_window_closed),
+            )
+            uia.AddPropertyChangedEventHandler(
+                element,
+                UIA.TreeScope_Element,
+                None,
+                _PropertyChangedEventHandler(self._on_property_changed),
+                [
+                    UIA_NAME_PROPERTY_ID,
+                    UIA_IS_ENABLED_PROPERTY_ID,
+                    UIA_IS_OFFSCREEN_PROPERTY_ID,
+                    UIA_BOUNDING_RECTANGLE_PROPERTY_ID,
+                ],
+            )
+            logging.debug("Subscribed to Phone Link UIA events")
+            self._pump_messages()
+        except Exception as exc:
+            logging.debug("UIA event subscription failed: %s", exc)
+        finally:
+            self.window_ready.clear()
+            if uia is not None:
+                try:
+                    uia.RemoveAllEventHandlers()
+                except Exception as exc:
+                    logging.debug("Removing UIA event handlers failed: %s", exc)
+            uia = None
+            comtypes.CoUninitialize()
+
+    def _pump_messages(self) -> None:  # pragma: no cover - Windows only
+        user32 = ctypes.windll.user32
+        msg = wintypes.MSG()
+        while not self._stop.is_set():
+            while user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_REMOVE):
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+            self._stop.wait(PUMP_INTERVAL)
+
+    def _on_window_closed(self, sender, event_id: int) -> None:  # pragma: no cover
+        # Dialogs and flyouts close inside the subtree too; only the main
+        # window closing makes the cached handles stale.  The runtime id is
+        # still readable on a closed element, unlike its HWND.
+        try:
+            if tuple(sender.GetRuntimeId()) == self._root_runtime_id:
+                self.window_ready.clear()
+        except Exception as exc:
+            logging.debug("Reading closed window runtime id failed: %s", exc)
+
+    def _on_property_changed(self, sender, property_id: int, new_value) -> None:  # pragma: no cover
+        self._record(sender)
+
+    def _record(self, element) -> None:  # pragma: no cover - Windows only
+        try:
+            name = element.CurrentName
+            control_type = element.CurrentControlType
+            visible = not element.CurrentIsOffscreen
+        except Exception as exc:
+            logging.debug("Reading UIA event element failed: %s", exc)
+            return
+        if IUIA is not None:
+            control_type = IUIA().known_control_type_ids.get(control_type, control_type)
+        with self._lock:
+            self._last_state = f"{name} | {control_type} | Visible={visible}"
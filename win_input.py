@@ -0,0 +1,128 @@
+"""Native keyboard input for QueueBreaker.
+
+:func:`send_shortcut` packs every key-down and key-up event of a shortcut into
+one ``INPUT`` array and hands it to ``user32.SendInput`` in a single call, so a
+shortcut costs one syscall and no per-key pauses.
+"""
+from __future__ import annotations
+
+import ctypes
+from ctypes import wintypes
+import logging
+from typing import Optional, Sequence
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+
+# Virtual-key codes (winuser.h) for the key names used in settings.json.
+_VK_CODES = {
+    "backspace": 0x08,
+    "tab": 0x09,
+    "enter": 0x0D,
+    "return": 0x0D,
+    "shift": 0x10,
+    "ctrl": 0x11,
+    "control": 0x11,
+    "alt": 0x12,
+    "esc": 0x1B,
+    "escape": 0x1B,
+    "space": 0x20,
+    "end": 0x23,
+    "home": 0x24,
+    "left": 0x25,
+    "up": 0x26,
+    "right": 0x27,
+    "down": 0x28,
+    "delete": 0x2E,
+    "del": 0x2E,
+    "win": 0x5B,
+    "windows": 0x5B,
+}
+_VK_CODES.update({f"f{n}": 0x6F + n for n in range(1, 13)})
+
+# Navigation keys and the Windows key sit on the extended key block; without
+# KEYEVENTF_EXTENDEDKEY they can arrive as their numpad counterparts.
+_EXTENDED_VK_CODES = frozenset({0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x2E, 0x5B})
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member; it must be present for SendInput to
+    # accept ``sizeof(INPUT)``.
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+
+def virtual_key(name: str) -> Optional[int]:
+    """Return the virtual-key code for ``name`` or ``None`` if unknown."""
+
+    name = name.lower()
+    if name in _VK_CODES:
+        return _VK_CODES[name]
+    if len(name) == 1 and name.isalnum() and name.isascii():
+        return ord(name.upper())
+    return None
+
+
+def send_shortcut(keys: Sequence[str]) -> bool:
+    """Press ``keys`` together with a single ``SendInput`` call.
+
+    Returns ``False`` without sending anything when ``SendInput`` is not
+    available or a key has no known virtual-key code, so callers can fall
+    back to another input backend.
+    """
+
+    windll = getattr(ctypes, "windll", None)
+    if windll is None or not keys:
+        return False
+    codes = [virtual_key(key) for key in keys]
+    if None in codes:
+        return False
+
+    events = (INPUT * (2 * len(codes)))()
+    order = [(code, 0) for code in codes] + [(code, KEYEVENTF_KEYUP) for code in reversed(codes)]
+    for event, (code, flags) in zip(events, order):
+        if code in _EXTENDED_VK_CODES:
+            flags |= KEYEVENTF_EXTENDEDKEY
+        event.type = INPUT_KEYBOARD
+        event.ki.wVk = code
+        event.ki.dwFlags = flags
+
+    sent = windll.user32.SendInput(len(events), events, ctypes.sizeof(INPUT))
+    if sent != len(events):  # pragma: no cover - Windows only
+        logging.debug("SendInput delivered %s of %s events", sent, len(events))
+        return False
+    return True